@@ -6,172 +6,388 @@ for all actions, without requiring any code changes in tests.
 """
 
 import time
+import inspect
 import functools
+from datetime import timedelta
 from typing import Callable, Any
 
-from .reporter import reporter
+from .reporter import env_number, reporter, truncate_error
 
-# Track if we've already patched to avoid double-patching
-_patched = False
+# page.wait_for_timeout() calls shorter than this (in ms) aren't reported
+MIN_WAIT_MS = env_number("PW_REPORTER_MIN_WAIT_MS", 100.0, float)
 
 
-def wrap_async_method(method: Callable, category: str, title_fn: Callable[..., str]):
-    """Wrap an async method to emit step events."""
-    @functools.wraps(method)
-    async def wrapper(*args, **kwargs):
-        title = title_fn(*args, **kwargs)
-        start_time = time.time()
+class _Elided:
+    """Stands in for an omitted argument; renders as ``...`` in titles."""
 
-        reporter.on_step_begin(title, category)
+    def __repr__(self) -> str:
+        return "..."
 
-        error = None
-        try:
-            result = await method(*args, **kwargs)
-            return result
-        except Exception as e:
-            error = str(e)
-            raise
-        finally:
-            duration_ms = (time.time() - start_time) * 1000
-            reporter.on_step_end(title, category, duration_ms, error)
+    __str__ = __repr__
 
-    # Mark as wrapped to avoid double-wrapping
-    wrapper._pw_reporter_wrapped = True
-    return wrapper
 
+ELIDED = _Elided()
+
+
+def split_params(params: tuple) -> tuple[tuple[str, ...], tuple[Any, ...]]:
+    """Split a table's params into names and their fallbacks for ``None``.
+
+    Each entry is a parameter name, or a ``(name, fallback)`` pair whose
+    fallback is shown in the title when the argument is ``None``.
+    """
+    names = tuple(p if isinstance(p, str) else p[0] for p in params)
+    fallbacks = tuple(None if isinstance(p, str) else p[1] for p in params)
+    return names, fallbacks
+
+
+def resolve_params(
+    params: tuple[str, ...],
+    fallbacks: tuple[Any, ...],
+    args: tuple,
+    kwargs: dict[str, Any],
+) -> list[Any]:
+    """Look up the named leading parameters (after ``self``) of a call.
+
+    Each is taken positionally when given, otherwise from ``kwargs``;
+    ``None`` is replaced by the param's fallback, if it has one.
+    """
+    n = len(args)
+    values = [args[i] if i < n else kwargs.get(name) for i, name in enumerate(params, 1)]
+    return [
+        fallback if value is None and fallback is not None else value
+        for value, fallback in zip(values, fallbacks)
+    ]
 
-def wrap_sync_method(method: Callable, category: str, title_fn: Callable[..., str]):
-    """Wrap a sync method to emit step events."""
-    @functools.wraps(method)
-    def wrapper(*args, **kwargs):
-        title = title_fn(*args, **kwargs)
-        start_time = time.time()
 
-        reporter.on_step_begin(title, category)
+def mark_wrapped(wrapper: Callable, method: Callable) -> Callable:
+    """Give wrapper the original's name and mark it to avoid double-wrapping.
 
-        error = None
+    Unlike functools.wraps this skips __doc__/__dict__ and doesn't set
+    __wrapped__, so introspection doesn't unwrap back to the original.
+    """
+    wrapper.__module__ = method.__module__
+    wrapper.__name__ = method.__name__
+    wrapper.__qualname__ = method.__qualname__
+    wrapper._pw_reporter_wrapped = True
+    return wrapper
+
+
+# Source for the step wrapper. When the method's signature can be mirrored,
+# its positional parameters are spelled out so calls skip packing/unpacking
+# *args and the title is formatted straight from those names; otherwise the
+# wrapper takes *_pw_args and looks the params up per call. Every local is
+# prefixed with _pw_ so none can shadow a mirrored parameter, and
+# __tracebackhide__ keeps the wrapper's frame out of pytest failure output.
+_WRAPPER_SOURCE = """\
+def make(_pw_method, _pw_category, _pw_template, _pw_describe, _pw_keep, _pw_resolve,
+         _pw_fallbacks, _pw_defaults, _pw_reporter, _pw_begin, _pw_end, _pw_pc,
+         _pw_truncate):
+    {async_}def wrapper({params}**_pw_kwargs):
+        __tracebackhide__ = True
+        if not _pw_reporter.enabled{keep_check}:
+            return {await_}_pw_method({args}**_pw_kwargs)
+
+        _pw_title = _pw_template.format({title_args})
+        _pw_step = {{"title": _pw_title, "category": _pw_category}}
+        _pw_start = _pw_pc()
+
+        _pw_begin(_pw_step)
+
+        _pw_error = None
         try:
-            result = method(*args, **kwargs)
-            return result
-        except Exception as e:
-            error = str(e)
+            return {await_}_pw_method({args}**_pw_kwargs)
+        except Exception as _pw_exc:
+            _pw_error = _pw_truncate(str(_pw_exc))
             raise
         finally:
-            duration_ms = (time.time() - start_time) * 1000
-            reporter.on_step_end(title, category, duration_ms, error)
+            _pw_duration_ms = (_pw_pc() - _pw_start) * 1000.0
+            _pw_end({{**_pw_step, "duration": _pw_duration_ms, "error": _pw_error}})
 
-    wrapper._pw_reporter_wrapped = True
     return wrapper
+"""
 
 
-def is_wrapped(method: Callable) -> bool:
-    """Check if a method is already wrapped."""
-    return getattr(method, '_pw_reporter_wrapped', False)
+def mirror_signature(
+    method: Callable,
+    params: tuple[str, ...],
+) -> tuple[list[str], list[str], list[Any]] | None:
+    """Describe the method's positional parameters for a specialized wrapper.
 
+    Returns (parameter source, argument names, default values), or None when
+    the signature can't be mirrored: unavailable, using positional-only or
+    ``*args`` parameters, or ``params`` naming something that isn't positional.
+    """
+    try:
+        signature = inspect.signature(method)
+    except (TypeError, ValueError):
+        return None
+
+    names: list[str] = []
+    parts: list[str] = []
+    defaults: list[Any] = []
+    for param in signature.parameters.values():
+        if param.kind is param.POSITIONAL_OR_KEYWORD:
+            if param.default is param.empty:
+                parts.append(param.name)
+            else:
+                parts.append(f"{param.name}=_pw_defaults[{len(defaults)}]")
+                defaults.append(param.default)
+            names.append(param.name)
+        elif param.kind is param.POSITIONAL_ONLY or param.kind is param.VAR_POSITIONAL:
+            return None
+
+    if not names or not set(params) <= set(names[1:]):
+        return None
+    return parts, names, defaults
+
+
+def build_wrapper(
+    method: Callable,
+    category: str,
+    template: str,
+    params: tuple,
+    describe: Callable[[Any], str] | None,
+    keep: Callable[..., bool] | None,
+    is_async: bool,
+) -> Callable:
+    """Generate a step-reporting wrapper for method from _WRAPPER_SOURCE."""
+    params, fallbacks = split_params(params)
+    mirrored = mirror_signature(method, params)
+    if mirrored is not None:
+        parts, names, defaults = mirrored
+        params_src = "".join(f"{part}, " for part in parts)
+        args_src = "".join(f"{name}, " for name in names)
+        values = ", ".join(
+            name if fallback is None else f"_pw_fallbacks[{i}] if {name} is None else {name}"
+            for i, (name, fallback) in enumerate(zip(params, fallbacks))
+        )
+        receiver = names[0]
+    else:
+        defaults = []
+        params_src = args_src = "*_pw_args, "
+        values = "*_pw_resolve(_pw_args, _pw_kwargs)"
+        receiver = "_pw_args[0]"
+
+    title_args = [values] if params else []
+    if describe is not None:
+        title_args.append(f"target=_pw_describe({receiver})")
+
+    source = _WRAPPER_SOURCE.format(
+        async_="async " if is_async else "",
+        await_="await " if is_async else "",
+        params=params_src,
+        args=args_src,
+        title_args=", ".join(title_args),
+        keep_check=f" or not _pw_keep({values})" if keep is not None else "",
+    )
+    namespace: dict[str, Any] = {"__name__": __name__}
+    exec(compile(source, f"<pw-reporter {method.__qualname__}>", "exec"), namespace)
+    wrapper = namespace["make"](
+        method, category, template, describe, keep,
+        functools.partial(resolve_params, params, fallbacks), fallbacks, tuple(defaults),
+        reporter, reporter.on_step_begin, reporter.on_step_end, time.perf_counter,
+        truncate_error,
+    )
+    return mark_wrapped(wrapper, method)
+
+
+def wrap_async_method(
+    method: Callable,
+    category: str,
+    template: str,
+    params: tuple = (),
+    describe: Callable[[Any], str] | None = None,
+    keep: Callable[..., bool] | None = None,
+):
+    """Wrap an async method to emit step events.
+
+    The title is only formatted when the reporter is enabled and ``keep``,
+    if given, accepts the call's params.
+    """
+    return build_wrapper(method, category, template, params, describe, keep, is_async=True)
+
+
+def wrap_sync_method(
+    method: Callable,
+    category: str,
+    template: str,
+    params: tuple = (),
+    describe: Callable[[Any], str] | None = None,
+    keep: Callable[..., bool] | None = None,
+):
+    """Wrap a sync method to emit step events."""
+    return build_wrapper(method, category, template, params, describe, keep, is_async=False)
 
-def patch_page_class(PageClass, is_async: bool = True):
-    """Patch a Page class with instrumentation."""
-    wrap = wrap_async_method if is_async else wrap_sync_method
 
-    # Navigation methods
-    methods_navigation = [
-        ("goto", lambda self, url, **kw: f"page.goto({url})"),
-        ("reload", lambda self, **kw: "page.reload()"),
-        ("go_back", lambda self, **kw: "page.go_back()"),
-        ("go_forward", lambda self, **kw: "page.go_forward()"),
-    ]
+def is_wrapped(method: Callable) -> bool:
+    """Check if a method is already wrapped."""
+    return getattr(method, '_pw_reporter_wrapped', False)
 
-    # Action methods
-    methods_action = [
-        ("click", lambda self, selector, **kw: f"page.click({selector})"),
-        ("dblclick", lambda self, selector, **kw: f"page.dblclick({selector})"),
-        ("fill", lambda self, selector, value, **kw: f"page.fill({selector}, {value!r})"),
-        ("type", lambda self, selector, text, **kw: f"page.type({selector}, {text!r})"),
-        ("press", lambda self, selector, key, **kw: f"page.press({selector}, {key})"),
-        ("check", lambda self, selector, **kw: f"page.check({selector})"),
-        ("uncheck", lambda self, selector, **kw: f"page.uncheck({selector})"),
-        ("select_option", lambda self, selector, **kw: f"page.select_option({selector})"),
-        ("hover", lambda self, selector, **kw: f"page.hover({selector})"),
-        ("focus", lambda self, selector, **kw: f"page.focus({selector})"),
-        ("drag_and_drop", lambda self, source, target, **kw: f"page.drag_and_drop({source}, {target})"),
-        ("screenshot", lambda self, **kw: "page.screenshot()"),
-        ("pdf", lambda self, **kw: "page.pdf()"),
-        ("set_input_files", lambda self, selector, files, **kw: f"page.set_input_files({selector}, ...)"),
-    ]
 
-    # Wait methods
-    methods_wait = [
-        ("wait_for_selector", lambda self, selector, **kw: f"page.wait_for_selector({selector})"),
-        ("wait_for_load_state", lambda self, state="load", **kw: f"page.wait_for_load_state({state})"),
-        ("wait_for_url", lambda self, url, **kw: f"page.wait_for_url({url})"),
-        ("wait_for_timeout", lambda self, timeout, **kw: f"page.wait_for_timeout({timeout})"),
-        ("wait_for_function", lambda self, expression, **kw: f"page.wait_for_function(...)"),
-    ]
+def is_long_wait(timeout: float | timedelta) -> bool:
+    """Only report fixed waits of at least MIN_WAIT_MS.
 
-    for name, title_fn in methods_navigation:
-        if hasattr(PageClass, name):
-            original = getattr(PageClass, name)
-            if not is_wrapped(original):
-                setattr(PageClass, name, wrap(original, "navigation", title_fn))
+    A timedelta is converted to milliseconds; anything else that can't be
+    compared is reported rather than risk hiding the call.
+    """
+    if isinstance(timeout, timedelta):
+        timeout = timeout.total_seconds() * 1000
+    try:
+        return timeout >= MIN_WAIT_MS
+    except TypeError:
+        return True
+
+
+# Method tables: (method name, title template, template params[, keep]).
+# Templates reference the params as {0}, {1}, ... and the receiver as {target};
+# a (name, fallback) param shows fallback when the argument is None.
+# The optional keep predicate receives the params and returns False to skip
+# reporting that call.
+_PAGE_NAVIGATION_METHODS = (
+    ("goto", "page.goto({0})", ("url",)),
+    ("reload", "page.reload()", ()),
+    ("go_back", "page.go_back()", ()),
+    ("go_forward", "page.go_forward()", ()),
+)
+
+_PAGE_ACTION_METHODS = (
+    ("click", "page.click({0})", ("selector",)),
+    ("dblclick", "page.dblclick({0})", ("selector",)),
+    ("fill", "page.fill({0}, {1!r})", ("selector", "value")),
+    ("type", "page.type({0}, {1!r})", ("selector", "text")),
+    ("press", "page.press({0}, {1})", ("selector", "key")),
+    ("check", "page.check({0})", ("selector",)),
+    ("uncheck", "page.uncheck({0})", ("selector",)),
+    ("select_option", "page.select_option({0})", ("selector",)),
+    ("hover", "page.hover({0})", ("selector",)),
+    ("focus", "page.focus({0})", ("selector",)),
+    ("drag_and_drop", "page.drag_and_drop({0}, {1})", ("source", "target")),
+    ("screenshot", "page.screenshot()", ()),
+    ("pdf", "page.pdf()", ()),
+    ("set_input_files", "page.set_input_files({0}, ...)", ("selector",)),
+)
+
+_PAGE_WAIT_METHODS = (
+    ("wait_for_selector", "page.wait_for_selector({0})", ("selector",)),
+    ("wait_for_load_state", "page.wait_for_load_state({0})", (("state", "load"),)),
+    ("wait_for_url", "page.wait_for_url({0})", ("url",)),
+    ("wait_for_timeout", "page.wait_for_timeout({0})", ("timeout",), is_long_wait),
+    ("wait_for_function", "page.wait_for_function(...)", ()),
+)
+
+_LOCATOR_ACTION_METHODS = (
+    ("click", "locator({target}).click()", ()),
+    ("dblclick", "locator({target}).dblclick()", ()),
+    ("fill", "locator({target}).fill({0!r})", ("value",)),
+    ("type", "locator({target}).type({0!r})", ("text",)),
+    ("press", "locator({target}).press({0})", ("key",)),
+    ("check", "locator({target}).check()", ()),
+    ("uncheck", "locator({target}).uncheck()", ()),
+    ("select_option", "locator({target}).select_option()", ()),
+    ("hover", "locator({target}).hover()", ()),
+    ("focus", "locator({target}).focus()", ()),
+    ("scroll_into_view_if_needed", "locator({target}).scroll_into_view_if_needed()", ()),
+    ("screenshot", "locator({target}).screenshot()", ()),
+    ("set_input_files", "locator({target}).set_input_files(...)", ()),
+    ("select_text", "locator({target}).select_text()", ()),
+    ("clear", "locator({target}).clear()", ()),
+)
+
+_LOCATOR_WAIT_METHODS = (
+    ("wait_for", "locator({target}).wait_for()", ()),
+)
+
+_ASSERTION_METHODS = (
+    ("to_be_visible", "expect({target}).to_be_visible()", ()),
+    ("to_be_hidden", "expect({target}).to_be_hidden()", ()),
+    ("to_be_enabled", "expect({target}).to_be_enabled()", ()),
+    ("to_be_disabled", "expect({target}).to_be_disabled()", ()),
+    ("to_be_checked", "expect({target}).to_be_checked()", ()),
+    ("to_be_focused", "expect({target}).to_be_focused()", ()),
+    ("to_be_editable", "expect({target}).to_be_editable()", ()),
+    ("to_be_empty", "expect({target}).to_be_empty()", ()),
+    ("to_be_attached", "expect({target}).to_be_attached()", ()),
+    ("to_be_in_viewport", "expect({target}).to_be_in_viewport()", ()),
+    ("to_have_text", "expect({target}).to_have_text({0!r})", ("expected",)),
+    ("to_contain_text", "expect({target}).to_contain_text({0!r})", ("expected",)),
+    ("to_have_value", "expect({target}).to_have_value({0!r})", ("value",)),
+    ("to_have_values", "expect({target}).to_have_values(...)", ()),
+    ("to_have_attribute", "expect({target}).to_have_attribute({0!r}, {1!r})", ("name", ("value", ELIDED))),
+    ("to_have_class", "expect({target}).to_have_class({0!r})", ("expected",)),
+    ("to_have_count", "expect({target}).to_have_count({0})", ("count",)),
+    ("to_have_css", "expect({target}).to_have_css({0!r}, {1!r})", ("name", "value")),
+    ("to_have_id", "expect({target}).to_have_id({0!r})", ("id",)),
+    ("to_have_js_property", "expect({target}).to_have_js_property({0!r}, ...)", ("name",)),
+    ("to_have_role", "expect({target}).to_have_role({0!r})", ("role",)),
+    ("to_have_accessible_name", "expect({target}).to_have_accessible_name({0!r})", ("name",)),
+    ("to_have_accessible_description", "expect({target}).to_have_accessible_description({0!r})", ("description",)),
+    # Negated versions are handled automatically by Playwright
+)
+
+
+def is_patched(cls) -> bool:
+    """Check if a class has already been patched."""
+    return vars(cls).get('_pw_reporter_patched', False)
+
+
+def wrap_methods(
+    cls,
+    methods: tuple[tuple, ...],
+    category: str,
+    wrap: Callable,
+    describe: Callable[[Any], str] | None = None,
+) -> dict[str, Callable]:
+    """Build wrappers for each method in a table that the class defines."""
+    # Playwright defines these methods on the class itself, so a single
+    # class dict lookup replaces the hasattr/getattr MRO walks
+    cls_dict = vars(cls)
+    wrapped = {}
+    for name, template, params, *keep in methods:
+        original = cls_dict.get(name)
+        if original is not None and not is_wrapped(original):
+            wrapped[name] = wrap(original, category, template, params, describe, *keep)
+    return wrapped
+
+
+def apply_patches(cls, wrapped: dict[str, Callable]):
+    """Install prepared wrappers on a class and mark it as patched."""
+    for name, wrapper in wrapped.items():
+        setattr(cls, name, wrapper)
+    cls._pw_reporter_patched = True
 
-    for name, title_fn in methods_action:
-        if hasattr(PageClass, name):
-            original = getattr(PageClass, name)
-            if not is_wrapped(original):
-                setattr(PageClass, name, wrap(original, "action", title_fn))
 
-    for name, title_fn in methods_wait:
-        if hasattr(PageClass, name):
-            original = getattr(PageClass, name)
-            if not is_wrapped(original):
-                setattr(PageClass, name, wrap(original, "wait", title_fn))
+def patch_page_class(PageClass, is_async: bool = True):
+    """Patch a Page class with instrumentation."""
+    if is_patched(PageClass):
+        return
+    wrap = wrap_async_method if is_async else wrap_sync_method
+    apply_patches(PageClass, {
+        **wrap_methods(PageClass, _PAGE_NAVIGATION_METHODS, "navigation", wrap),
+        **wrap_methods(PageClass, _PAGE_ACTION_METHODS, "action", wrap),
+        **wrap_methods(PageClass, _PAGE_WAIT_METHODS, "wait", wrap),
+    })
 
 
 def patch_locator_class(LocatorClass, is_async: bool = True):
     """Patch a Locator class with instrumentation."""
+    if is_patched(LocatorClass):
+        return
     wrap = wrap_async_method if is_async else wrap_sync_method
 
     def get_locator_desc(locator) -> str:
         """Get a human-readable description of the locator."""
         return str(locator)
 
-    methods_action = [
-        ("click", lambda self, **kw: f"locator({get_locator_desc(self)}).click()"),
-        ("dblclick", lambda self, **kw: f"locator({get_locator_desc(self)}).dblclick()"),
-        ("fill", lambda self, value, **kw: f"locator({get_locator_desc(self)}).fill({value!r})"),
-        ("type", lambda self, text, **kw: f"locator({get_locator_desc(self)}).type({text!r})"),
-        ("press", lambda self, key, **kw: f"locator({get_locator_desc(self)}).press({key})"),
-        ("check", lambda self, **kw: f"locator({get_locator_desc(self)}).check()"),
-        ("uncheck", lambda self, **kw: f"locator({get_locator_desc(self)}).uncheck()"),
-        ("select_option", lambda self, **kw: f"locator({get_locator_desc(self)}).select_option()"),
-        ("hover", lambda self, **kw: f"locator({get_locator_desc(self)}).hover()"),
-        ("focus", lambda self, **kw: f"locator({get_locator_desc(self)}).focus()"),
-        ("scroll_into_view_if_needed", lambda self, **kw: f"locator({get_locator_desc(self)}).scroll_into_view_if_needed()"),
-        ("screenshot", lambda self, **kw: f"locator({get_locator_desc(self)}).screenshot()"),
-        ("set_input_files", lambda self, files, **kw: f"locator({get_locator_desc(self)}).set_input_files(...)"),
-        ("select_text", lambda self, **kw: f"locator({get_locator_desc(self)}).select_text()"),
-        ("clear", lambda self, **kw: f"locator({get_locator_desc(self)}).clear()"),
-    ]
-
-    methods_wait = [
-        ("wait_for", lambda self, **kw: f"locator({get_locator_desc(self)}).wait_for()"),
-    ]
-
-    for name, title_fn in methods_action:
-        if hasattr(LocatorClass, name):
-            original = getattr(LocatorClass, name)
-            if not is_wrapped(original):
-                setattr(LocatorClass, name, wrap(original, "action", title_fn))
-
-    for name, title_fn in methods_wait:
-        if hasattr(LocatorClass, name):
-            original = getattr(LocatorClass, name)
-            if not is_wrapped(original):
-                setattr(LocatorClass, name, wrap(original, "wait", title_fn))
+    apply_patches(LocatorClass, {
+        **wrap_methods(LocatorClass, _LOCATOR_ACTION_METHODS, "action", wrap, get_locator_desc),
+        **wrap_methods(LocatorClass, _LOCATOR_WAIT_METHODS, "wait", wrap, get_locator_desc),
+    })
 
 
 def patch_assertions_class(AssertionsClass, is_async: bool = True):
     """Patch LocatorAssertions class with instrumentation."""
+    if is_patched(AssertionsClass):
+        return
     wrap = wrap_async_method if is_async else wrap_sync_method
 
     def get_locator_desc(assertions) -> str:
@@ -179,52 +395,22 @@ def patch_assertions_class(AssertionsClass, is_async: bool = True):
         # The locator is nested inside _impl_obj for sync/async wrappers
         impl = getattr(assertions, '_impl_obj', assertions)
         for attr in ('_actual_locator', '_locator', 'actual'):
-            if hasattr(impl, attr):
-                loc = getattr(impl, attr)
-                if loc is not None:
-                    return str(loc)
+            loc = getattr(impl, attr, None)
+            if loc is not None:
+                return str(loc)
         return "locator"
 
-    methods = [
-        ("to_be_visible", lambda self, **kw: f"expect({get_locator_desc(self)}).to_be_visible()"),
-        ("to_be_hidden", lambda self, **kw: f"expect({get_locator_desc(self)}).to_be_hidden()"),
-        ("to_be_enabled", lambda self, **kw: f"expect({get_locator_desc(self)}).to_be_enabled()"),
-        ("to_be_disabled", lambda self, **kw: f"expect({get_locator_desc(self)}).to_be_disabled()"),
-        ("to_be_checked", lambda self, **kw: f"expect({get_locator_desc(self)}).to_be_checked()"),
-        ("to_be_focused", lambda self, **kw: f"expect({get_locator_desc(self)}).to_be_focused()"),
-        ("to_be_editable", lambda self, **kw: f"expect({get_locator_desc(self)}).to_be_editable()"),
-        ("to_be_empty", lambda self, **kw: f"expect({get_locator_desc(self)}).to_be_empty()"),
-        ("to_be_attached", lambda self, **kw: f"expect({get_locator_desc(self)}).to_be_attached()"),
-        ("to_be_in_viewport", lambda self, **kw: f"expect({get_locator_desc(self)}).to_be_in_viewport()"),
-        ("to_have_text", lambda self, expected, **kw: f"expect({get_locator_desc(self)}).to_have_text({expected!r})"),
-        ("to_contain_text", lambda self, expected, **kw: f"expect({get_locator_desc(self)}).to_contain_text({expected!r})"),
-        ("to_have_value", lambda self, value, **kw: f"expect({get_locator_desc(self)}).to_have_value({value!r})"),
-        ("to_have_values", lambda self, values, **kw: f"expect({get_locator_desc(self)}).to_have_values(...)"),
-        ("to_have_attribute", lambda self, name, value, **kw: f"expect({get_locator_desc(self)}).to_have_attribute({name!r}, {value!r})"),
-        ("to_have_class", lambda self, expected, **kw: f"expect({get_locator_desc(self)}).to_have_class({expected!r})"),
-        ("to_have_count", lambda self, count, **kw: f"expect({get_locator_desc(self)}).to_have_count({count})"),
-        ("to_have_css", lambda self, name, value, **kw: f"expect({get_locator_desc(self)}).to_have_css({name!r}, {value!r})"),
-        ("to_have_id", lambda self, id, **kw: f"expect({get_locator_desc(self)}).to_have_id({id!r})"),
-        ("to_have_js_property", lambda self, name, value, **kw: f"expect({get_locator_desc(self)}).to_have_js_property({name!r}, ...)"),
-        ("to_have_role", lambda self, role, **kw: f"expect({get_locator_desc(self)}).to_have_role({role!r})"),
-        ("to_have_accessible_name", lambda self, name, **kw: f"expect({get_locator_desc(self)}).to_have_accessible_name({name!r})"),
-        ("to_have_accessible_description", lambda self, description, **kw: f"expect({get_locator_desc(self)}).to_have_accessible_description({description!r})"),
-        # Negated versions are handled automatically by Playwright
-    ]
-
-    for name, title_fn in methods:
-        if hasattr(AssertionsClass, name):
-            original = getattr(AssertionsClass, name)
-            if not is_wrapped(original):
-                setattr(AssertionsClass, name, wrap(original, "assertion", title_fn))
+    apply_patches(AssertionsClass, {
+        **wrap_methods(AssertionsClass, _ASSERTION_METHODS, "assertion", wrap, get_locator_desc),
+    })
 
 
 def patch_playwright():
-    """Patch all Playwright classes with instrumentation."""
-    global _patched
-    if _patched:
-        return
+    """Patch all Playwright classes with instrumentation.
 
+    Safe to call repeatedly: each class records that it was patched on
+    itself, so the guard survives this module being reloaded.
+    """
     try:
         # Patch async API
         from playwright.async_api._generated import Page as AsyncPage
@@ -248,5 +434,3 @@ def patch_playwright():
         patch_assertions_class(SyncLocatorAssertions, is_async=False)
     except ImportError:
         pass
-
-    _patched = True
@@ -2,20 +2,48 @@
 Pytest plugin for automatic Playwright instrumentation.
 
 This plugin:
-1. Patches Playwright classes at pytest startup
+1. Patches Playwright classes once collection shows they are used
 2. Emits JSON events for test lifecycle
 3. Captures step-level events for all Playwright actions
 """
 
+import sys
+
 import pytest
-from .reporter import reporter
+from .reporter import reporter, truncate_error
 from .instrumentation import patch_playwright
 
+# Fixtures that mean a test drives Playwright
+PLAYWRIGHT_FIXTURES = frozenset({"page", "context", "browser", "browser_context", "playwright"})
+
+
+def pytest_addoption(parser: pytest.Parser):
+    """Register command line options."""
+    group = parser.getgroup("pw-reporter")
+    group.addoption(
+        "--no-pw-reporter",
+        action="store_true",
+        default=False,
+        help="Disable the reporter entirely, emitting no events (same as PW_REPORTER=0).",
+    )
+
 
 def pytest_configure(config: pytest.Config):
     """Called after command line options have been parsed."""
-    # Patch Playwright classes before any tests run
-    patch_playwright()
+    if config.getoption("no_pw_reporter"):
+        reporter.set_enabled(False)
+
+
+def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config, items: list[pytest.Item]):
+    """Patch Playwright before any tests run, if the session uses it."""
+    if not reporter.enabled:
+        return
+    # Test modules and conftests are imported by now, so a session that
+    # never loaded Playwright doesn't pay for importing or patching it
+    if "playwright" in sys.modules or any(
+        PLAYWRIGHT_FIXTURES.intersection(getattr(item, "fixturenames", ())) for item in items
+    ):
+        patch_playwright()
 
 
 def pytest_sessionstart(session: pytest.Session):
@@ -33,6 +61,7 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int):
         "testsfailed": session.testsfailed,
         "testscollected": session.testscollected,
     })
+    reporter.flush()
 
 
 def pytest_runtest_logstart(nodeid: str, location: tuple[str, int | None, str]):
@@ -65,8 +94,9 @@ def pytest_runtest_logreport(report: pytest.TestReport):
         })
         if report.failed:
             reporter.log_event("onError", {
-                "error": str(report.longrepr) if report.longrepr else None,
+                "error": truncate_error(str(report.longrepr)) if report.longrepr else None,
             })
+            reporter.flush()
 
 
 def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
@@ -76,6 +106,6 @@ def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
             "step": {
                 "title": call.when,
                 "duration": call.duration,
-                "error": str(call.excinfo.value),
+                "error": truncate_error(str(call.excinfo.value)),
             }
         })
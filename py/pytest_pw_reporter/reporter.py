@@ -1,46 +1,251 @@
 """JSON event reporter for Playwright tests."""
 
+import atexit
+import functools
 import json
+import os
+import queue
 import sys
+import threading
+import time
+import warnings
+from collections import deque
 from datetime import datetime
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_time = time.time
+
+# Tells the writer thread to write what it has and exit
+_CLOSE = object()
+
+
+def _discard(item: Any):
+    """Stands in for queueing while no writer thread is running."""
+
+
+def env_number(name: str, default: int | float, parse: type = int) -> int | float:
+    """Read a numeric setting from the environment.
+
+    This runs at import, while pytest loads the plugin, so a malformed value
+    warns and falls back to the default instead of breaking every run.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return parse(value)
+    except ValueError:
+        warnings.warn(f"Ignoring {name}={value!r}: not a valid number, using {default}")
+        return default
+
+
+# Longest error text included in an event; full tracebacks can run to
+# hundreds of KB (set PW_REPORTER_MAX_ERROR to change)
+MAX_ERROR_LENGTH = env_number("PW_REPORTER_MAX_ERROR", 8192)
+
+
+def truncate_error(error: str, limit: int = MAX_ERROR_LENGTH) -> str:
+    """Cut error text down to limit characters, noting how much was dropped."""
+    if len(error) <= limit:
+        return error
+    return f"{error[:limit]}...<{len(error) - limit} chars truncated>"
+
+
+def _orjson_dumps(obj: Any) -> str:
+    """Serialize with orjson, stringifying anything it can't encode natively.
+
+    orjson rejects some payloads json accepts (ints beyond 64 bits, non-str
+    dict keys); those fall back to json.dumps.
+    """
+    try:
+        return orjson.dumps(obj, default=str).decode()
+    except TypeError:
+        return json.dumps(obj, default=str)
+
 
 class JSONReporter:
     """Emits JSON events for test lifecycle and Playwright steps."""
 
-    def __init__(self, output=None):
+    def __init__(
+        self,
+        output=None,
+        enabled: bool = True,
+        indent: int | None = None,
+        keep_history: bool = False,
+        history_size: int | None = 1000,
+        flush_interval: float | None = 1.0,
+    ):
         self.output = output or sys.stdout
-        self.events: list[dict[str, Any]] = []
+        self.enabled = enabled
+        # With keep_history, the most recent events are kept for
+        # introspection (history_size=None keeps everything); otherwise
+        # events only go to output. Payloads carry epoch-seconds
+        # timestamps, formatted as ISO on output.
+        self._keep = keep_history
+        self.events: deque[dict[str, Any]] | None = (
+            deque(maxlen=history_size) if keep_history else None
+        )
+
+        # Cache hot-path callables so log_event avoids repeated lookups.
+        # Output is one compact JSON object per line unless indent is set.
+        # orjson is used when installed, except for indented debug output.
+        if orjson is not None and indent is None:
+            self._dumps = _orjson_dumps
+        else:
+            self._dumps = functools.partial(json.dumps, indent=indent, default=str)
+        self._write = self.output.write
+        self._events_append = self.events.append if keep_history else None
+        self._fromtimestamp = datetime.fromtimestamp
 
-    def log_event(self, event: str, data: dict[str, Any] | None = None):
+        # Events are handed to a writer thread, which serializes and writes
+        # them in batches covering up to flush_interval seconds (None writes
+        # whatever is queued as soon as it arrives). A disabled reporter
+        # starts no thread until it is enabled, and events emitted while no
+        # thread runs are dropped.
+        self.flush_interval = flush_interval
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._put = _discard
+        self._writer: threading.Thread | None = None
+        if enabled:
+            self._start_writer()
+
+    def _start_writer(self):
+        """Start the writer thread and close it at interpreter exit."""
+        self._writer = threading.Thread(target=self._drain, name="pw-reporter-writer", daemon=True)
+        self._writer.start()
+        self._put = self._queue.put
+        atexit.register(self.close)
+
+    def log_event(self, event: str, data: dict[str, Any] | None = None, _time=_time):
         """Log a JSON event to output."""
-        payload = {"event": event, "timestamp": datetime.now().isoformat()}
+        if not self.enabled:
+            return
+        payload = {"event": event, "timestamp": _time()}
         if data:
             payload.update(data)
-        self.events.append(payload)
-        print(json.dumps(payload, indent=2, default=str), file=self.output)
-
-    def on_step_begin(self, title: str, category: str):
-        """Called when a Playwright step begins."""
-        self.log_event("onStepBegin", {
-            "step": {
-                "title": title,
-                "category": category,
-            }
-        })
-
-    def on_step_end(self, title: str, category: str, duration_ms: float, error: str | None = None):
-        """Called when a Playwright step ends."""
-        self.log_event("onStepEnd", {
-            "step": {
-                "title": title,
-                "category": category,
-                "duration": duration_ms,
-                "error": error,
-            }
-        })
-
-
-# Global reporter instance
-reporter = JSONReporter()
+        self._emit(payload)
+
+    def _emit(self, payload: dict[str, Any]):
+        """Record a complete event payload and queue it for output."""
+        if self._keep:
+            self._events_append(payload)
+        self._put(payload)
+
+    def flush(self, timeout: float | None = 5.0):
+        """Block until every event queued so far is written and flushed."""
+        if self._writer is None or not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._put(done)
+        done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0):
+        """Write any queued events and stop the writer thread.
+
+        Later events are dropped until set_enabled(True) starts a new one.
+        """
+        if self._writer is None:
+            return
+        atexit.unregister(self.close)
+        self._put = _discard
+        if self._writer.is_alive():
+            self._queue.put(_CLOSE)
+            self._writer.join(timeout)
+        self._writer = None
+
+    def _drain(self):
+        """Writer thread: serialize and write queued events in batches."""
+        get = self._queue.get
+        interval = self.flush_interval
+        item = None
+        while item is not _CLOSE:
+            item = get()
+            batch = []
+            deadline = time.monotonic() + (interval or 0.0)
+            # Collect events until the window closes or a control item
+            # (flush request or close) arrives
+            while isinstance(item, dict):
+                batch.append(item)
+                try:
+                    item = get(timeout=max(deadline - time.monotonic(), 0.0))
+                except queue.Empty:
+                    item = None
+            # A failing output (e.g. closed at interpreter exit) drops the
+            # batch rather than killing the thread, so flush() never hangs
+            try:
+                if batch:
+                    self._write("\n".join(map(self._serialize, batch)) + "\n")
+                # The stream itself is only flushed on request, not per batch
+                if item is _CLOSE or isinstance(item, threading.Event):
+                    self.output.flush()
+            except Exception:
+                pass
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def _serialize(self, payload: dict[str, Any]) -> str:
+        """Serialize a payload, converting its timestamp to ISO format.
+
+        Timestamps that aren't epoch seconds (e.g. set through log_event's
+        data) are written as given.
+        """
+        try:
+            iso = self._fromtimestamp(payload["timestamp"]).isoformat()
+        except (TypeError, ValueError, OverflowError, OSError):
+            pass
+        else:
+            payload = {**payload, "timestamp": iso}
+        try:
+            return self._dumps(payload)
+        except Exception:
+            pass
+        # Stringify whatever the serializer rejected; failing that, record
+        # the event with the error instead of its data
+        try:
+            return json.dumps(payload, default=str)
+        except Exception as e:
+            return json.dumps(
+                {
+                    "event": str(payload.get("event")),
+                    "timestamp": str(payload.get("timestamp")),
+                    "error": f"unserializable payload: {e!r}",
+                }
+            )
+
+    def set_enabled(self, enabled: bool):
+        """Turn emission of all events, lifecycle and step alike, on or off.
+
+        The plugin skips patching Playwright when the reporter is disabled at
+        collection, so enabling it afterwards brings back lifecycle events
+        only; call instrumentation.patch_playwright() for step events too.
+        """
+        self.enabled = enabled
+        if enabled and self._writer is None:
+            self._start_writer()
+
+    def on_step_begin(self, step: dict[str, Any], _time=_time):
+        """Called when a Playwright step begins with its title and category."""
+        if self.enabled:
+            self._emit({"event": "onStepBegin", "timestamp": _time(), "step": step})
+
+    def on_step_end(self, step: dict[str, Any], _time=_time):
+        """Called when a Playwright step ends, with duration and error added."""
+        if self.enabled:
+            self._emit({"event": "onStepEnd", "timestamp": _time(), "step": step})
+
+
+# Global reporter instance (set PW_REPORTER=0 to disable,
+# PW_REPORTER_DEBUG=1 to pretty-print events, PW_REPORTER_HISTORY=N to
+# keep the last N events in memory)
+_history_size = env_number("PW_REPORTER_HISTORY", 0)
+reporter = JSONReporter(
+    enabled=os.environ.get("PW_REPORTER", "1") != "0",
+    indent=2 if os.environ.get("PW_REPORTER_DEBUG") == "1" else None,
+    keep_history=_history_size > 0,
+    history_size=_history_size,
+)
@@ -1,22 +1,43 @@
 """Minimal conftest for async Playwright + base_url."""
 
 import pytest
+import pytest_asyncio
 from pathlib import Path
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import async_playwright, Browser, Page
 
 BASE_URL = "https://evals.desplega.ai"
 ARTIFACTS_DIR = Path("test-results")
 
 
-@pytest.fixture
-async def page(request) -> Page:  # type: ignore
-    ARTIFACTS_DIR.mkdir(exist_ok=True)
-    test_name = request.node.name
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--record-artifacts",
+        action="store_true",
+        default=False,
+        help="Record a HAR, video and trace for every test into test-results/.",
+    )
+
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser() -> Browser:  # type: ignore
+    # One browser for the whole session; each test gets its own context
     async with async_playwright() as p:
         # browser = await p.chromium.connect("ws://localhost:3003")
         browser = await p.chromium.launch()
 
+        yield browser  # type: ignore
+
+        await browser.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(browser: Browser, request) -> Page:  # type: ignore
+    test_name = request.node.name
+    record = request.config.getoption("--record-artifacts")
+
+    if record:
+        ARTIFACTS_DIR.mkdir(exist_ok=True)
+
         # Create context with HAR and video recording
         context = await browser.new_context(
             base_url=BASE_URL,
@@ -26,30 +47,33 @@ async def page(request) -> Page:  # type: ignore
 
         # Start tracing
         await context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    else:
+        context = await browser.new_context(base_url=BASE_URL)
 
-        page = await context.new_page()
+    page = await context.new_page()
 
-        yield page  # type: ignore
+    yield page  # type: ignore
 
-        # Save trace
+    # Save trace
+    if record:
         await context.tracing.stop(path=ARTIFACTS_DIR / f"{test_name}.zip")
 
-        # Screenshot on failure
-        if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
-            await page.screenshot(path=ARTIFACTS_DIR / f"{test_name}-failed.png")
+    # Screenshot on failure
+    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
+        ARTIFACTS_DIR.mkdir(exist_ok=True)
+        await page.screenshot(path=ARTIFACTS_DIR / f"{test_name}-failed.png")
 
-        # Get video reference before closing page
-        video = page.video
+    # Get video reference before closing page (None unless recording)
+    video = page.video
 
-        # Close page to finalize the video
-        await page.close()
+    # Close page to finalize the video
+    await page.close()
 
-        # Save video from remote browser (after page is closed)
-        if video:
-            await video.save_as(ARTIFACTS_DIR / f"{test_name}.webm")
+    # Save video from remote browser (after page is closed)
+    if video:
+        await video.save_as(ARTIFACTS_DIR / f"{test_name}.webm")
 
-        await context.close()
-        await browser.close()
+    await context.close()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -0,0 +1,176 @@
+"""Unit tests for the Playwright instrumentation (no browser needed)."""
+
+import io
+from datetime import timedelta
+
+import pytest
+
+from pytest_pw_reporter import instrumentation
+from pytest_pw_reporter.reporter import MAX_ERROR_LENGTH, JSONReporter
+
+
+@pytest.fixture
+def events(monkeypatch):
+    """Route wrappers created during the test to a fresh in-memory reporter."""
+    test_reporter = JSONReporter(io.StringIO(), keep_history=True)
+    monkeypatch.setattr(instrumentation, "reporter", test_reporter)
+    yield test_reporter.events
+    test_reporter.close()
+
+
+def make_page_class():
+    class FakePage:
+        async def goto(self, url, *, timeout=None):
+            return url
+
+        async def fill(self, selector, value, *, timeout=None):
+            return (selector, value)
+
+        async def click(self, selector, **kwargs):
+            raise RuntimeError("element not found")
+
+    return FakePage
+
+
+def steps(events):
+    return [(e["event"], e["step"]["title"]) for e in events]
+
+
+async def test_wrapper_reports_begin_and_end(events):
+    Page = make_page_class()
+    instrumentation.patch_page_class(Page)
+
+    assert await Page().goto("/home") == "/home"
+    assert await Page().fill("#name", value="Ada") == ("#name", "Ada")
+
+    assert steps(events) == [
+        ("onStepBegin", "page.goto(/home)"),
+        ("onStepEnd", "page.goto(/home)"),
+        ("onStepBegin", "page.fill(#name, 'Ada')"),
+        ("onStepEnd", "page.fill(#name, 'Ada')"),
+    ]
+    assert events[1]["step"]["category"] == "navigation"
+    assert events[1]["step"]["error"] is None
+
+
+async def test_wrapper_records_and_reraises_errors(events):
+    Page = make_page_class()
+    instrumentation.patch_page_class(Page)
+
+    with pytest.raises(RuntimeError):
+        await Page().click("#missing")
+
+    assert events[-1]["step"]["error"] == "element not found"
+
+
+async def test_wrapper_frames_are_hidden_from_pytest_tracebacks(events):
+    Page = make_page_class()
+    instrumentation.patch_page_class(Page)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        await Page().click("#missing")
+
+    frames = [entry.name for entry in excinfo.traceback.filter(excinfo)]
+    assert "wrapper" not in frames
+    assert "click" in frames
+
+
+async def test_wrapper_truncates_long_errors(events):
+    class FakePage:
+        async def goto(self, url):
+            raise RuntimeError("x" * (MAX_ERROR_LENGTH + 10))
+
+    instrumentation.patch_page_class(FakePage)
+
+    with pytest.raises(RuntimeError):
+        await FakePage().goto("/")
+
+    assert events[-1]["step"]["error"].endswith("...<10 chars truncated>")
+
+
+async def test_wrapper_keeps_parameter_names_that_match_its_locals(events):
+    class FakePage:
+        async def goto(self, url, title=None, step=None, error=None, start=None):
+            return (url, title, step, error, start)
+
+    instrumentation.patch_page_class(FakePage)
+
+    result = await FakePage().goto("/", "t", "s", "e", 1)
+
+    assert result == ("/", "t", "s", "e", 1)
+    assert steps(events)[0] == ("onStepBegin", "page.goto(/)")
+
+
+def test_wrapper_falls_back_for_unmirrorable_signatures(events):
+    class FakeLocator:
+        def __str__(self):
+            return "<loc>"
+
+        def fill(self, *args, **kwargs):
+            return args
+
+    instrumentation.patch_locator_class(FakeLocator, is_async=False)
+
+    assert FakeLocator().fill("x") == ("x",)
+    assert steps(events)[0] == ("onStepBegin", "locator(<loc>).fill('x')")
+
+
+def test_wrapper_keeps_method_identity():
+    Page = make_page_class()
+    instrumentation.patch_page_class(Page)
+
+    assert Page.goto.__name__ == "goto"
+    assert Page.goto.__module__ == __name__
+    assert instrumentation.is_wrapped(Page.goto)
+
+
+async def test_disabled_reporter_skips_events(events, monkeypatch):
+    Page = make_page_class()
+    instrumentation.patch_page_class(Page)
+    monkeypatch.setattr(instrumentation.reporter, "enabled", False)
+
+    assert await Page().goto("/") == "/"
+    assert not events
+
+
+async def test_title_shows_fallback_for_none_arguments(events):
+    class FakePage:
+        async def wait_for_load_state(self, state=None, *, timeout=None):
+            return state
+
+    class FakeAssertions:
+        _impl_obj = type("Impl", (), {"_actual_locator": "#id"})()
+
+        def to_have_attribute(self, *args, **kwargs):
+            return None
+
+    instrumentation.patch_page_class(FakePage)
+    instrumentation.patch_assertions_class(FakeAssertions, is_async=False)
+
+    await FakePage().wait_for_load_state()
+    await FakePage().wait_for_load_state("networkidle")
+    FakeAssertions().to_have_attribute("id")
+
+    assert [title for event, title in steps(events) if event == "onStepBegin"] == [
+        "page.wait_for_load_state(load)",
+        "page.wait_for_load_state(networkidle)",
+        "expect(#id).to_have_attribute('id', ...)",
+    ]
+
+
+async def test_short_waits_are_skipped(events):
+    class FakePage:
+        async def wait_for_timeout(self, timeout):
+            return timeout
+
+    instrumentation.patch_page_class(FakePage)
+
+    await FakePage().wait_for_timeout(10)
+    assert await FakePage().wait_for_timeout(timedelta(milliseconds=10)) == timedelta(milliseconds=10)
+    await FakePage().wait_for_timeout(timedelta(seconds=1))
+    await FakePage().wait_for_timeout("soon")
+
+    assert [title for event, title in steps(events) if event == "onStepBegin"] == [
+        "page.wait_for_timeout(0:00:01)",
+        "page.wait_for_timeout(soon)",
+    ]
@@ -0,0 +1,121 @@
+"""Unit tests for the JSON reporter."""
+
+import gc
+import io
+import json
+import weakref
+
+import pytest
+
+from pytest_pw_reporter.reporter import JSONReporter, _orjson_dumps, env_number
+
+
+def test_orjson_dumps_falls_back_for_payloads_orjson_rejects():
+    pytest.importorskip("orjson")
+    payload = {"n": 2**70, 1: "non-str key"}
+
+    assert json.loads(_orjson_dumps(payload)) == {
+        "n": 2**70,
+        "1": "non-str key",
+    }
+
+
+def test_env_number_falls_back_on_malformed_values(monkeypatch):
+    monkeypatch.setenv("PW_REPORTER_TEST_NUMBER", "abc")
+    with pytest.warns(UserWarning, match="PW_REPORTER_TEST_NUMBER"):
+        assert env_number("PW_REPORTER_TEST_NUMBER", 8192) == 8192
+
+    monkeypatch.setenv("PW_REPORTER_TEST_NUMBER", "12.5")
+    assert env_number("PW_REPORTER_TEST_NUMBER", 100.0, float) == 12.5
+    monkeypatch.delenv("PW_REPORTER_TEST_NUMBER")
+    assert env_number("PW_REPORTER_TEST_NUMBER", 100.0, float) == 100.0
+
+
+def test_writer_survives_unserializable_payloads():
+    output = io.StringIO()
+    test_reporter = JSONReporter(output, flush_interval=None)
+    circular = {}
+    circular["self"] = circular
+
+    test_reporter.log_event("onBad", {"data": circular})
+    test_reporter.log_event("onGood", {"data": object()})
+    test_reporter.log_event("onAfter")
+    test_reporter.flush()
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [line["event"] for line in lines] == ["onBad", "onGood", "onAfter"]
+    assert "unserializable payload" in lines[0]["error"]
+    assert lines[1]["data"].startswith("<object object")
+    assert test_reporter._writer.is_alive()
+    test_reporter.close()
+
+
+def test_custom_timestamps_are_written_as_given():
+    output = io.StringIO()
+    test_reporter = JSONReporter(output, flush_interval=None)
+
+    test_reporter.log_event("onA")
+    test_reporter.log_event("onB", {"timestamp": "custom"})
+    test_reporter.log_event("onC")
+    test_reporter.close()
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [line["event"] for line in lines] == ["onA", "onB", "onC"]
+    assert lines[1]["timestamp"] == "custom"
+    assert lines[2]["timestamp"] != "custom"
+
+
+def test_writer_survives_a_failing_output():
+    class BrokenOutput(io.StringIO):
+        def write(self, s):
+            raise ValueError("I/O operation on closed file")
+
+    test_reporter = JSONReporter(BrokenOutput(), flush_interval=None)
+
+    test_reporter.log_event("onLost")
+    test_reporter.flush()
+
+    assert test_reporter._writer.is_alive()
+    test_reporter.close()
+
+
+def test_disabled_reporter_starts_no_writer_until_enabled():
+    output = io.StringIO()
+    test_reporter = JSONReporter(output, enabled=False)
+
+    assert test_reporter._writer is None
+    test_reporter.flush()
+    test_reporter.close()
+
+    test_reporter.set_enabled(True)
+    test_reporter.log_event("onEnabled")
+    test_reporter.close()
+
+    assert json.loads(output.getvalue())["event"] == "onEnabled"
+
+
+def test_close_stops_writing_until_reenabled():
+    output = io.StringIO()
+    test_reporter = JSONReporter(output)
+    test_reporter.log_event("onBefore")
+    test_reporter.close()
+
+    test_reporter.log_event("onDropped")
+    test_reporter.flush()
+    test_reporter.set_enabled(True)
+    test_reporter.log_event("onAfter")
+    test_reporter.close()
+
+    events = [json.loads(line)["event"] for line in output.getvalue().splitlines()]
+    assert events == ["onBefore", "onAfter"]
+
+
+def test_closed_reporter_is_not_kept_alive_by_the_exit_hook():
+    test_reporter = JSONReporter(io.StringIO())
+    test_reporter.close()
+    ref = weakref.ref(test_reporter)
+
+    del test_reporter
+    gc.collect()
+
+    assert ref() is None